@@ -1,16 +1,75 @@
 import asyncio
+import atexit
 import hashlib
-import json
+import io
+import itertools
 import logging
 import os
+import re
 import shutil
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from typing import Optional
 
+import blake3
+import cachetools
+import msgpack
+import orjson
+import simdjson
 from fastapi import FastAPI
 from mcp.server.fastmcp import FastMCP
 
+# Per-thread SIMD parser for the read-only load path; reusing a parser
+# lets simdjson recycle its internal tape buffer between documents, and
+# keeping one per thread makes the parallel startup load safe.
+_PARSER_LOCAL = threading.local()
+
+
+def _get_parser() -> simdjson.Parser:
+    parser = getattr(_PARSER_LOCAL, 'parser', None)
+    if parser is None:
+        parser = _PARSER_LOCAL.parser = simdjson.Parser()
+    return parser
+
+# Tokenizer for the inverted search index
+_WORD_RE = re.compile(r"\w+")
+
+
+class _SafeNameTable(dict):
+    """str.translate table replacing unsafe filename chars with '_'.
+
+    Precomputed for ASCII; entries for other codepoints are derived on
+    first use and cached, so sanitizing runs entirely in C afterwards.
+    """
+
+    def __missing__(self, codepoint: int) -> str:
+        char = chr(codepoint)
+        result = char if char.isalnum() or char in '-_' else '_'
+        self[codepoint] = result
+        return result
+
+
+_SAFE_NAME_TABLE = _SafeNameTable(
+    (i, chr(i) if chr(i).isalnum() or chr(i) in '-_' else '_')
+    for i in range(128)
+)
+
+
+def _msgpack_default(obj):
+    """Encode types msgpack has no native representation for."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Cannot serialize {type(obj).__name__} to msgpack")
+
+
+def _pack(data: dict) -> bytes:
+    """Serialize a note or index dict to the compact on-disk format."""
+    return msgpack.packb(data, use_bin_type=True, default=_msgpack_default)
+
 # Configure logging
 logger = logging.getLogger('pinthepiece.server')
 logger.setLevel(logging.DEBUG)
@@ -53,62 +112,166 @@ class Note:
         "last_backup": None,
         "checksum": None
     })
+    # Memoized checksum: (id(content), modified, digest)
+    _checksum_cache: Optional[tuple] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Lazily cached lowercase forms used by search; cleared on mutation
+    _content_lower: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _tags_lower: Optional[frozenset] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Cached isoformat strings; each save and response formatter needs
+    # them, and datetime.isoformat reallocates on every call
+    _created_iso: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _modified_iso: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def content_lower(self) -> str:
+        if self._content_lower is None:
+            self._content_lower = self.content.lower()
+        return self._content_lower
+
+    @property
+    def tags_lower(self) -> frozenset[str]:
+        if self._tags_lower is None:
+            self._tags_lower = frozenset(t.lower() for t in self.tags)
+        return self._tags_lower
+
+    @property
+    def created_iso(self) -> str:
+        if self._created_iso is None:
+            self._created_iso = self.created.isoformat()
+        return self._created_iso
+
+    @property
+    def modified_iso(self) -> str:
+        if self._modified_iso is None:
+            self._modified_iso = self.modified.isoformat()
+        return self._modified_iso
 
     def to_dict(self) -> dict:
+        # The cached timestamp strings serve both the serialized fields
+        # and the checksum input
+        created_iso = self.created_iso
+        modified_iso = self.modified_iso
         data = {
             'name': self.name,
             'content': self.content,
             'tags': self.tags,
             'description': self.description,
-            'created': self.created.isoformat(),
+            'created': created_iso,
             'version': self.VERSION,
             'metadata': self.metadata,
         }
-        data['modified'] = self.modified.isoformat()
-        # Update checksum before saving
-        content_str = (
-            f"{self.content}{self.created.isoformat()}"
-            f"{self.modified.isoformat()}"
-        )
-        self.metadata['checksum'] = hashlib.sha256(content_str.encode()).hexdigest()
+        data['modified'] = modified_iso
+        # Update checksum before saving, reusing the memoized digest when
+        # neither the content object nor the modified timestamp changed
+        cache_key = (id(self.content), self.modified)
+        if self._checksum_cache and self._checksum_cache[:2] == cache_key:
+            digest = self._checksum_cache[2]
+        else:
+            # Feed the hasher incrementally instead of concatenating a
+            # content-sized temporary string first
+            h = blake3.blake3()
+            h.update(self.content.encode())
+            h.update(created_iso.encode())
+            h.update(modified_iso.encode())
+            digest = h.hexdigest(length=16)
+            self._checksum_cache = (*cache_key, digest)
+        self.metadata['checksum'] = digest
         return data
 
     @classmethod
-    def from_dict(cls, data: dict) -> 'Note':
+    def from_dict(cls, data) -> 'Note':
+        """Create a Note from a decoded mapping.
+
+        Accepts a plain dict or a lazy simdjson Object; only the handful
+        of top-level keys are accessed, so unused subtrees of a lazy
+        document are never materialized.
+        """
         version = data.get('version', 0)
         if version > cls.VERSION:
             raise ValueError(
                 f"Note version {version} is newer than supported version {cls.VERSION}"
             )
 
+        tags = data.get('tags')
+        metadata = data.get('metadata')
+        if metadata is None:
+            metadata = {}
+        elif not isinstance(metadata, dict):
+            metadata = metadata.as_dict()
+
         # Create note instance
         note = cls(
-            name=data['name'],
-            content=data['content'],
-            tags=data.get('tags', []),
+            name=str(data['name']),
+            content=str(data['content']),
+            tags=list(tags) if tags is not None else [],
             description=data.get('description'),
             created=datetime.fromisoformat(data['created']),
             modified=datetime.fromisoformat(data['modified']),
-            metadata=data.get('metadata', {}),
+            metadata=metadata,
         )
 
         # Validate checksum if available
-        if metadata.get('checksum'):
-            content_str = (
-                f"{note.content}{note.created.isoformat()}"
-                f"{note.modified.isoformat()}"
-            )
-            current_checksum = hashlib.sha256(content_str.encode()).hexdigest()
-            if current_checksum != metadata['checksum']:
+        checksum = metadata.get('checksum')
+        if checksum:
+            # Legacy SHA-256 checksums from older versions are 64 hex chars
+            legacy = len(checksum) == 64
+            h = hashlib.sha256() if legacy else blake3.blake3()
+            h.update(note.content.encode())
+            h.update(note.created_iso.encode())
+            h.update(note.modified_iso.encode())
+            current_checksum = h.hexdigest() if legacy else h.hexdigest(length=16)
+            if current_checksum != checksum:
                 raise ValueError("Note content checksum validation failed")
 
         return note
 
 class ResourceManager:
-    def __init__(self, storage_dir: str = None):
-        self.notes: dict[str, Note] = {}
+    def __init__(self, storage_dir: str = None, cache_size: int = 256):
+        # Bounded cache of deserialized notes; the index knows about every
+        # note, notes themselves are loaded on demand and evicted LRU
+        self.notes: cachetools.LRUCache = cachetools.LRUCache(maxsize=cache_size)
+        # _lock guards the in-memory maps; per-note locks serialize disk
+        # writes for one note so different notes can save concurrently
         self._lock = asyncio.Lock()
+        # Per-name write locks, refcounted so entries can be dropped once
+        # the last task using a name releases it; see _note_lock
+        self._note_locks: dict[str, list] = {}
         self._subscribers: list[asyncio.Queue] = []
+        # blake3 digest of each note's last successful save, used to
+        # short-circuit writes that would be byte-identical; fixed-size
+        # per note, unlike keeping the serialized payloads around
+        self._last_saved_digest: dict[str, bytes] = {}
+        # Inverted search indexes: content token -> names, description
+        # token -> names, lowercased tag -> names, plus reverse maps so
+        # notes can be unindexed. These cover every note, cached or not,
+        # so search only loads candidate hits from disk.
+        self._token_index: dict[str, set[str]] = defaultdict(set)
+        self._desc_index: dict[str, set[str]] = defaultdict(set)
+        self._tag_index: dict[str, set[str]] = defaultdict(set)
+        self._note_tokens: dict[str, set[str]] = {}
+        self._note_desc_tokens: dict[str, set[str]] = {}
+        self._note_tags: dict[str, set[str]] = {}
+        # Group commit: pending (temp path, name, index entry) keyed by
+        # final path, fsynced and published in batches by the flusher task.
+        # The publish lock orders the flusher against file deletions.
+        self._pending_renames: dict[str, tuple[str, str, dict]] = {}
+        self._pending_lock = threading.Lock()
+        self._publish_lock = threading.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_tasks: set[asyncio.Task] = set()
+        self._flush_delay = 0.005
+        self._flush_batch_size = 32
+        self._temp_counter = itertools.count()
 
         # Set up storage directory structure
         self.storage_dir = storage_dir or os.path.expanduser('~/.pinthepiece')
@@ -116,6 +279,7 @@ class ResourceManager:
         self.data_dir = os.path.join(self.notes_dir, 'data')
         self.backup_dir = os.path.join(self.notes_dir, 'backups')
         self.index_file = os.path.join(self.notes_dir, 'index.json')
+        self.index_log_file = os.path.join(self.notes_dir, 'index.log')
 
         # Create directory structure
         for directory in [self.storage_dir, self.notes_dir, self.data_dir, self.backup_dir]:
@@ -123,18 +287,31 @@ class ResourceManager:
 
         logger.info(f"Initialized ResourceManager with storage directory: {self.storage_dir}")
 
-        # Initialize index if it doesn't exist
-        if not os.path.exists(self.index_file):
-            self._save_index({})
+        # The in-memory index is authoritative: snapshot plus journal
+        # replay. The snapshot is read from disk exactly once, here;
+        # everything else goes through self._index and _index_put.
+        self._index: dict = self._load_index()
+        self._replay_index_log()
+        self._index_lock = threading.Lock()
+        self._index_log_fd = os.open(
+            self.index_log_file,
+            os.O_APPEND | os.O_WRONLY | os.O_CREAT,
+            0o644,
+        )
+        self._log_size = os.path.getsize(self.index_log_file)
 
         # Load existing notes
         self._load_notes()
 
+        # A clean interpreter exit inside the flush delay must not drop
+        # writes that were already acknowledged to the client
+        atexit.register(self._flush_pending)
+
     def _get_note_path(self, name: str, created: datetime = None) -> str:
         """Get the hierarchical file path for a note."""
         if created is None:
             # If no creation date provided, try to get it from index
-            index = self._load_index()
+            index = self._index
             if name in index:
                 created = datetime.fromisoformat(index[name]['created'])
             else:
@@ -145,15 +322,19 @@ class ResourceManager:
         month_dir = os.path.join(year_dir, f"{created.month:02d}")
         os.makedirs(month_dir, exist_ok=True)
 
-        safe_name = "".join(c if c.isalnum() or c in ('-', '_') else '_' for c in name)
+        safe_name = name.translate(_SAFE_NAME_TABLE)
         return os.path.join(month_dir, f"{safe_name}.json")
 
     def _load_index(self) -> dict:
         """Load the note index file."""
         try:
             if os.path.exists(self.index_file):
-                with open(self.index_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                with open(self.index_file, 'rb') as f:
+                    buf = f.read()
+                if buf[:1] == b'{':
+                    # Legacy pretty-printed JSON index
+                    return orjson.loads(buf)
+                return msgpack.unpackb(buf, raw=False)
         except Exception as e:
             logger.error(f"Error loading index: {e}", exc_info=True)
         return {}
@@ -162,8 +343,8 @@ class ResourceManager:
         """Save the note index file atomically."""
         temp_path = f"{self.index_file}.tmp"
         try:
-            with open(temp_path, 'w', encoding='utf-8') as f:
-                json.dump(index, f, indent=2)
+            with open(temp_path, 'wb') as f:
+                f.write(_pack(index))
                 f.flush()
                 os.fsync(f.fileno())
             os.replace(temp_path, self.index_file)
@@ -172,6 +353,137 @@ class ResourceManager:
             if os.path.exists(temp_path):
                 os.unlink(temp_path)
 
+    def _index_note_tokens(self, name: str, note: Note) -> None:
+        """Add a note's content, description and tags to the search indexes."""
+        self._unindex_note_tokens(name)
+        tokens = set(_WORD_RE.findall(note.content_lower))
+        for token in tokens:
+            self._token_index[token].add(name)
+        desc_tokens = (
+            set(_WORD_RE.findall(note.description.lower()))
+            if note.description else set()
+        )
+        for token in desc_tokens:
+            self._desc_index[token].add(name)
+        tags = set(note.tags_lower)
+        for tag in tags:
+            self._tag_index[tag].add(name)
+        self._note_tokens[name] = tokens
+        self._note_desc_tokens[name] = desc_tokens
+        self._note_tags[name] = tags
+
+    def _unindex_note_tokens(self, name: str) -> None:
+        """Remove a note's postings from the search indexes."""
+        for reverse, forward in (
+            (self._note_tokens, self._token_index),
+            (self._note_desc_tokens, self._desc_index),
+            (self._note_tags, self._tag_index),
+        ):
+            for key in reverse.pop(name, ()):
+                postings = forward.get(key)
+                if postings is not None:
+                    postings.discard(name)
+                    if not postings:
+                        del forward[key]
+
+    def _replay_index_log(self) -> None:
+        """Apply journaled updates on top of the index snapshot."""
+        if not os.path.exists(self.index_log_file):
+            return
+        try:
+            with open(self.index_log_file, 'rb') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = orjson.loads(line)
+                    except orjson.JSONDecodeError:
+                        # Torn write at the tail of the log; stop replaying.
+                        logger.warning(
+                            "Truncated record in index log, stopping replay"
+                        )
+                        break
+                    if record.get('op') == 'delete':
+                        self._index.pop(record['name'], None)
+                    else:
+                        self._index[record['name']] = record['entry']
+        except Exception as e:
+            logger.error(f"Error replaying index log: {e}", exc_info=True)
+
+    def _append_index_log(self, records: list[dict]) -> None:
+        """Append journal records in one write and make them durable."""
+        lines = b''.join(orjson.dumps(record) + b'\n' for record in records)
+        os.write(self._index_log_fd, lines)
+        os.fdatasync(self._index_log_fd)
+        self._log_size += len(lines)
+
+    def _index_entry(self, note: Note, file_path: str) -> dict:
+        """Build a note's index entry: its location plus the fields that
+        listings and brief summaries need, so those never open note files.
+        """
+        return {
+            'path': file_path,
+            'created': note.created_iso,
+            'modified': note.modified_iso,
+            'version': note.VERSION,
+            'tags': list(note.tags),
+            'description': note.description,
+            'excerpt': note.content[:50],
+        }
+
+    def _index_put(self, name: str, entry: dict) -> None:
+        """Update one index entry in memory.
+
+        The journal record is written by the flusher via _index_commit
+        once the note file itself is durable, so a crash can lose a
+        recent note but never leave the index pointing at a file that
+        was never published.
+        """
+        with self._index_lock:
+            self._index[name] = entry
+
+    def _index_commit(self, entries: list[tuple[str, dict]]) -> None:
+        """Journal index entries whose note files are now durable."""
+        with self._index_lock:
+            self._append_index_log([
+                {'op': 'put', 'name': name, 'entry': entry}
+                for name, entry in entries
+            ])
+            self._maybe_compact_index()
+
+    def _index_delete(self, name: str) -> None:
+        """Remove one index entry and journal the deletion."""
+        with self._index_lock:
+            if self._index.pop(name, None) is not None:
+                self._append_index_log([{'op': 'delete', 'name': name}])
+                self._maybe_compact_index()
+
+    def _maybe_compact_index(self) -> None:
+        """Fold the journal into the snapshot once it outgrows it 4x."""
+        try:
+            snapshot_size = os.path.getsize(self.index_file)
+        except OSError:
+            snapshot_size = 0
+        if self._log_size < 4 * max(snapshot_size, 1024):
+            return
+        # Entries whose file has never been published must not become
+        # durable through the snapshot; keep a pending entry only if an
+        # earlier version of its file already exists on disk.
+        with self._pending_lock:
+            pending_paths = set(self._pending_renames)
+        snapshot = self._index
+        if pending_paths:
+            snapshot = {
+                name: entry for name, entry in self._index.items()
+                if entry['path'] not in pending_paths
+                or os.path.exists(entry['path'])
+            }
+        self._save_index(snapshot)
+        os.ftruncate(self._index_log_fd, 0)
+        self._log_size = 0
+        logger.debug("Compacted index log into snapshot")
+
     def _create_backup(self, note_path: str) -> str:
         """Create a backup of a note file."""
         if not os.path.exists(note_path):
@@ -182,50 +494,91 @@ class ResourceManager:
         backup_path = os.path.join(self.backup_dir, backup_name)
 
         try:
-            shutil.copy2(note_path, backup_path)
+            # O(1): the backup becomes a snapshot of the current inode.
+            # This is safe because saves never write a note in place;
+            # os.replace later points the note at a fresh inode.
+            os.link(note_path, backup_path)
+            return backup_path
+        except OSError:
+            # Cross-device link or a filesystem without hardlinks;
+            # fall through to a byte copy
+            pass
+
+        try:
+            if hasattr(os, 'copy_file_range'):
+                # Kernel-side copy: no userspace buffer, and reflink-capable
+                # filesystems turn it into an O(1) clone
+                with open(note_path, 'rb') as src, \
+                        open(backup_path, 'wb') as dst:
+                    remaining = os.fstat(src.fileno()).st_size
+                    while remaining > 0:
+                        copied = os.copy_file_range(
+                            src.fileno(), dst.fileno(), remaining
+                        )
+                        if copied == 0:
+                            break
+                        remaining -= copied
+            else:
+                shutil.copy2(note_path, backup_path)
             return backup_path
         except Exception as e:
             logger.error(f"Error creating backup: {e}", exc_info=True)
             return None
 
-    async def _save_note(self, name: str, note: Note) -> None:
-        """Save a note to disk with atomic operations and backup."""
+    def _save_note(self, name: str, note: Note) -> None:
+        """Save a note to disk with atomic operations and backup.
+
+        Blocking; callers on the event loop run it via asyncio.to_thread.
+        """
         file_path = self._get_note_path(name, note.created)
         logger.debug(f"Saving note {name} to: {file_path}")
 
+        # Skip the write entirely if nothing changed since the last save
+        payload = _pack(note.to_dict())
+        if self._last_saved_digest.get(name) == blake3.blake3(payload).digest():
+            logger.debug(f"Note {name} unchanged since last save, skipping write")
+            return
+
         # Create backup of existing file
         if os.path.exists(file_path):
             backup_path = self._create_backup(file_path)
             if backup_path:
                 note.metadata['last_backup'] = datetime.now().isoformat()
                 logger.debug(f"Created backup at: {backup_path}")
+                # Re-pack so the saved bytes include the new backup stamp
+                payload = _pack(note.to_dict())
 
-        # Update index
-        index = self._load_index()
-        index[name] = {
-            'path': file_path,
-            'created': note.created.isoformat(),
-            'modified': note.modified.isoformat(),
-            'version': note.VERSION
-        }
-
-        # Save note file atomically
-        temp_path = f"{file_path}.tmp"
+        # Save note file atomically; the rename and fsync are deferred to
+        # the group-commit flusher so bursts of saves share one sync
+        temp_path = f"{file_path}.{next(self._temp_counter)}.tmp"
         try:
             # Ensure directory exists
             os.makedirs(os.path.dirname(file_path), exist_ok=True)
 
-            # Write to temporary file
-            with open(temp_path, 'w', encoding='utf-8') as f:
-                json.dump(note.to_dict(), f, indent=2, ensure_ascii=False)
-                f.flush()
-                os.fsync(f.fileno())
-
-            # Atomic rename
-            os.replace(temp_path, file_path)
-
-            # Update index after successful save
-            self._save_index(index)
+            # Hand the payload to the kernel in one write syscall instead
+            # of going through a buffered file object
+            fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                written = os.write(fd, payload)
+                while written < len(payload):
+                    written += os.write(fd, payload[written:])
+            finally:
+                os.close(fd)
+
+            # Queue the publish; a later write of the same note before the
+            # flush simply supersedes this one. The flusher journals the
+            # index entry once the data is durable.
+            entry = self._index_entry(note, file_path)
+            with self._pending_lock:
+                superseded = self._pending_renames.get(file_path)
+                self._pending_renames[file_path] = (temp_path, name, entry)
+            if superseded:
+                try:
+                    os.unlink(superseded[0])
+                except OSError:
+                    pass
+            self._last_saved_digest[name] = blake3.blake3(payload).digest()
+            self._index_put(name, entry)
 
             logger.info(f"Successfully saved note: {name}")
 
@@ -238,38 +591,217 @@ class ResourceManager:
                     pass
             raise
 
+    def _migrate_note_file(self, file_path: str, note: Note) -> None:
+        """Rewrite a legacy JSON note file in the binary format."""
+        temp_path = f"{file_path}.tmp"
+        try:
+            with open(temp_path, 'wb') as f:
+                f.write(_pack(note.to_dict()))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, file_path)
+            logger.debug(f"Migrated legacy JSON note to msgpack: {file_path}")
+        except Exception as e:
+            logger.error(f"Error migrating note file {file_path}: {e}", exc_info=True)
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+
+    def _flush_pending(self) -> None:
+        """Publish queued note writes: fsync, rename, dir sync, journal.
+
+        The index journal records are appended only after the note data
+        is durable, so replay never resurrects a name whose file was lost
+        in a crash. The publish lock keeps the rename/journal sequence
+        atomic with respect to concurrent deletes.
+        """
+        with self._publish_lock:
+            with self._pending_lock:
+                pending = list(self._pending_renames.items())
+                self._pending_renames.clear()
+            if not pending:
+                return
+
+            dirs = set()
+            published = []
+            for file_path, (temp_path, name, entry) in pending:
+                try:
+                    fd = os.open(temp_path, os.O_RDONLY)
+                    try:
+                        os.fsync(fd)
+                    finally:
+                        os.close(fd)
+                    os.replace(temp_path, file_path)
+                    dirs.add(os.path.dirname(file_path))
+                    published.append((name, entry))
+                except FileNotFoundError:
+                    continue
+                except Exception as e:
+                    logger.error(
+                        f"Error flushing note write to {file_path}: {e}",
+                        exc_info=True,
+                    )
+
+            # A single directory fsync per batch makes all the renames durable
+            for directory in dirs:
+                try:
+                    dir_fd = os.open(directory, os.O_RDONLY)
+                    try:
+                        os.fsync(dir_fd)
+                    finally:
+                        os.close(dir_fd)
+                except OSError:
+                    pass
+            if published:
+                self._index_commit(published)
+            logger.debug(f"Flushed {len(pending)} pending note write(s)")
+
+    def _delete_note_file(self, file_path: str) -> None:
+        """Remove a note's file and any queued write of it.
+
+        Blocking; holds the publish lock so a flush in flight cannot
+        re-create the file after the unlink.
+        """
+        with self._publish_lock:
+            with self._pending_lock:
+                queued = self._pending_renames.pop(file_path, None)
+            if queued:
+                try:
+                    os.unlink(queued[0])
+                except OSError:
+                    pass
+            os.unlink(file_path)
+
+    def _spawn_flush(self, coro) -> asyncio.Task:
+        """Run a flush coroutine as a task the manager keeps alive.
+
+        The event loop only holds tasks weakly, so an unreferenced flush
+        could be collected mid-run and any exception it raised would
+        vanish; the task set pins it and the done callback logs failures.
+        """
+        task = asyncio.create_task(coro)
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_done)
+        return task
+
+    def _flush_done(self, task: asyncio.Task) -> None:
+        self._flush_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(
+                "Background flush failed", exc_info=task.exception()
+            )
+
+    def _schedule_flush(self) -> None:
+        """Flush soon: immediately for large batches, else after a delay."""
+        with self._pending_lock:
+            pending_count = len(self._pending_renames)
+        if pending_count >= self._flush_batch_size:
+            self._spawn_flush(self.flush())
+        elif self._flush_task is None or self._flush_task.done():
+            self._flush_task = self._spawn_flush(self._delayed_flush())
+
+    async def _delayed_flush(self) -> None:
+        await asyncio.sleep(self._flush_delay)
+        await self.flush()
+
+    async def flush(self) -> None:
+        """Force all pending note writes to durable storage."""
+        await asyncio.to_thread(self._flush_pending)
+
+    def _load_one(self, file_path: str) -> Note:
+        """Read and deserialize a single note file."""
+        with open(file_path, 'rb') as f:
+            buf = f.read()
+        if buf[:1] == b'{':
+            # Legacy JSON note: lazy SIMD parse, then migrate the
+            # file to the compact binary format in place.
+            note = Note.from_dict(_get_parser().parse(buf))
+            self._migrate_note_file(file_path, note)
+        else:
+            note = Note.from_dict(msgpack.unpackb(buf, raw=False))
+        return note
+
+    async def _get_or_load(self, name: str) -> Optional[Note]:
+        """Return a note from the cache, loading it from disk on a miss.
+
+        Must be called with self._lock held; returns None if the note
+        does not exist or cannot be read.
+        """
+        note = self.notes.get(name)
+        if note is not None:
+            return note
+        info = self._index.get(name)
+        if info is None:
+            return None
+        try:
+            note = await asyncio.to_thread(self._load_one, info['path'])
+        except Exception as e:
+            logger.error(f"Error loading note {name}: {e}", exc_info=True)
+            return None
+        self.notes[name] = note
+        return note
+
     def _load_notes(self) -> None:
-        """Load all notes from disk using the index."""
+        """Build the search indexes from disk and warm the note cache.
+
+        Every note is streamed through once so the inverted indexes cover
+        the whole library; resident memory stays bounded by the LRU cache.
+        """
         if not os.path.exists(self.notes_dir):
             logger.warning(f"Notes directory does not exist: {self.notes_dir}")
             return
 
+        # Temp files from writes that never got published (crash before
+        # the flush) are dead weight; sweep them before loading
+        stale = 0
+        for root, _dirs, files in os.walk(self.data_dir):
+            for fname in files:
+                if fname.endswith('.tmp'):
+                    try:
+                        os.unlink(os.path.join(root, fname))
+                        stale += 1
+                    except OSError:
+                        pass
+        if stale:
+            logger.info(f"Removed {stale} stale temp file(s)")
+
         logger.info(f"Loading notes from: {self.notes_dir}")
         loaded_count = 0
         error_count = 0
 
-        # Load from index
-        index = self._load_index()
-        for name, info in index.items():
+        def load_entry(item: tuple) -> tuple:
+            name, info = item
             file_path = info['path']
             if not os.path.exists(file_path):
                 logger.warning(f"Note file missing: {file_path}")
-                continue
-
+                return name, None, False
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.notes[name] = Note.from_dict(data)
-                    loaded_count += 1
-                    logger.debug(f"Loaded note: {name} from {file_path}")
-            except json.JSONDecodeError as e:
-                error_count += 1
-                logger.error(f"JSON decode error loading note {name}: {e}")
+                note = self._load_one(file_path)
+                logger.debug(f"Loaded note: {name} from {file_path}")
+                return name, note, False
             except Exception as e:
-                error_count += 1
                 logger.error(f"Error loading note {name}: {e}", exc_info=True)
-
-        logger.info(f"Loaded {loaded_count} notes successfully, {error_count} errors")
+                return name, None, True
+
+        # The reads and decodes are I/O bound and release the GIL, so the
+        # startup scan parallelizes well; indexing the results stays on
+        # this thread since the posting maps are not thread-safe.
+        entries = list(self._index.items())
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for name, note, failed in executor.map(load_entry, entries):
+                if note is None:
+                    error_count += failed
+                    continue
+                self.notes[name] = note
+                self._index_note_tokens(name, note)
+                # Backfill listing fields on entries written before they
+                # were part of the index; compaction persists them later
+                info = self._index.get(name)
+                if info is not None and 'tags' not in info:
+                    info.update(self._index_entry(note, info['path']))
+                loaded_count += 1
+
+        logger.info(f"Indexed {loaded_count} notes successfully, {error_count} errors")
 
     async def subscribe_to_changes(self) -> asyncio.Queue:
         """Subscribe to resource changes."""
@@ -282,59 +814,89 @@ class ResourceManager:
         if queue in self._subscribers:
             self._subscribers.remove(queue)
 
-    async def _notify_changes(self) -> None:
-        """Notify all subscribers of resource changes."""
+    def _notify_changes(self) -> None:
+        """Notify all subscribers of resource changes without yielding."""
         for subscriber in self._subscribers:
-            await subscriber.put("resource_changed")
+            try:
+                subscriber.put_nowait("resource_changed")
+            except asyncio.QueueFull:
+                # Subscriber is backlogged; the notifications already in
+                # its queue coalesce with this one.
+                pass
+
+    @asynccontextmanager
+    async def _note_lock(self, name: str):
+        """Serialize writers of one note name.
+
+        Entries are refcounted: the count covers waiters as well as the
+        holder, so the map sheds a name only once the last task using its
+        lock has released it and no new lock object can be minted while
+        another task still references the old one. All bookkeeping runs
+        on the event loop with no await between check and update.
+        """
+        entry = self._note_locks.get(name)
+        if entry is None:
+            entry = self._note_locks[name] = [asyncio.Lock(), 0]
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                yield
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0:
+                del self._note_locks[name]
 
     async def add_note(
-        self, 
-        name: str, 
-        content: str, 
-        tags: list[str] = None, 
+        self,
+        name: str,
+        content: str,
+        tags: list[str] = None,
         description: str = None
     ) -> Note:
         """Add a new note."""
         logger.info(f"Adding new note: {name}")
 
-        async with self._lock:
-            if name in self.notes:
-                raise ValueError(f"Note already exists: {name}")
-
-            # Create note object
-            note = Note(
-                name=name,
-                content=content,
-                tags=tags or [],
-                description=description
-            )
+        async with self._note_lock(name):
+            async with self._lock:
+                if name in self._index or name in self.notes:
+                    raise ValueError(f"Note already exists: {name}")
+
+                # Create note object
+                now = datetime.now()
+                note = Note(
+                    name=name,
+                    content=content,
+                    tags=tags or [],
+                    description=description,
+                    created=now,
+                    modified=now,
+                )
             logger.debug(
                 f"Created note object for {name} with {len(content)} characters"
             )
 
-            # Create note path based on creation date
+            # Save note and index entry off the event loop; the flusher
+            # journals the index update once the data is durable
             try:
-                self._save_note(name, note)
-                index = self._load_index()
-                index['notes'][name] = {
-                    'path': self._get_note_path(name),
-                    'created': note.created.isoformat(),
-                }
-                self._save_index(index)
+                await asyncio.to_thread(self._save_note, name, note)
             except Exception as e:
                 logger.error(f"Failed to save note {name}: {e}", exc_info=True)
                 raise ValueError(f"Failed to save note: {e}") from e
 
             # If save successful, update memory
-            self.notes[name] = note
-            await self._notify_changes()
+            async with self._lock:
+                self.notes[name] = note
+                self._index_note_tokens(name, note)
+            self._schedule_flush()
+            self._notify_changes()
             return note
 
     async def get_note(self, name: str) -> Note:
         async with self._lock:
-            if name not in self.notes:
+            note = await self._get_or_load(name)
+            if note is None:
                 raise ValueError(f"Note not found: {name}")
-            return self.notes[name]
+            return note
 
     async def update_note(
         self, 
@@ -346,21 +908,29 @@ class ResourceManager:
         """Update an existing note."""
         logger.info(f"Updating note: {name}")
 
-        async with self._lock:
-            if name not in self.notes:
-                raise ValueError(f"Note not found: {name}")
-
-            note = self.notes[name]
-
-            # Update fields if provided
-            if content is not None:
-                note.content = content
-            if tags is not None:
-                note.tags = tags
-            if description is not None:
-                note.description = description
-
-            note.modified = datetime.now()
+        async with self._note_lock(name):
+            async with self._lock:
+                note = await self._get_or_load(name)
+                if note is None:
+                    raise ValueError(f"Note not found: {name}")
+
+                # Update fields if provided, clearing cached lowercase forms
+                if content is not None:
+                    note.content = content
+                    note._content_lower = None
+                if tags is not None:
+                    note.tags = tags
+                    note._tags_lower = None
+                if description is not None:
+                    note.description = description
+
+                # Only bump the modified timestamp when something was
+                # provided, so no-op updates serialize identically and
+                # skip the disk write
+                if (content is not None or tags is not None
+                        or description is not None):
+                    note.modified = datetime.now()
+                    note._modified_iso = None
 
             logger.debug(
                 f"Modified note {name} with new content length: {len(note.content)}"
@@ -371,40 +941,83 @@ class ResourceManager:
                 await asyncio.to_thread(self._save_note, name, note)
             except Exception as e:
                 logger.error(
-                    f"Failed to save updated note {name}: {e}", 
+                    f"Failed to save updated note {name}: {e}",
                     exc_info=True
                 )
                 raise ValueError(f"Failed to save note: {e}") from e
 
-            await self._notify_changes()
+            async with self._lock:
+                self._index_note_tokens(name, note)
+            self._schedule_flush()
+            self._notify_changes()
             return note
 
     async def delete_note(self, name: str) -> None:
         """Delete a note."""
         logger.info(f"Deleting note: {name}")
-        async with self._lock:
-            if name not in self.notes:
-                logger.warning(f"Note not found for deletion: {name}")
-                raise ValueError(f"Note not found: {name}")
-
-            # Remove from memory
-            del self.notes[name]
-
-            # Remove from disk
+        async with self._note_lock(name):
+            async with self._lock:
+                if name not in self._index and name not in self.notes:
+                    logger.warning(f"Note not found for deletion: {name}")
+                    raise ValueError(f"Note not found: {name}")
+
+                # Remove from memory
+                self.notes.pop(name, None)
+                self._unindex_note_tokens(name)
+
+            # Remove from disk off the event loop, including any write of
+            # this note still queued for publishing
             file_path = self._get_note_path(name)
             try:
-                if os.path.exists(file_path):
-                    os.unlink(file_path)
-                    logger.debug(f"Deleted note file: {file_path}")
+                await asyncio.to_thread(self._delete_note_file, file_path)
+                logger.debug(f"Deleted note file: {file_path}")
+            except FileNotFoundError:
+                pass
             except Exception as e:
                 logger.error(f"Error deleting note file {name}: {e}", exc_info=True)
 
-            await self._notify_changes()
+            # Drop the index entry so the note is not resurrected on replay
+            self._index_delete(name)
+            self._last_saved_digest.pop(name, None)
+
+            self._notify_changes()
             logger.info(f"Successfully deleted note: {name}")
 
     async def list_notes(self) -> list[str]:
         async with self._lock:
-            return list(self.notes.keys())
+            return list(self._index.keys())
+
+    async def list_entries(self) -> list[tuple[str, dict]]:
+        """Return (name, index entry) pairs without touching note files."""
+        async with self._lock:
+            return list(self._index.items())
+
+    async def snapshot(self) -> list[Note]:
+        """Return every note, for consumers that need full content.
+
+        Cached notes are collected in one short locked step; the rest are
+        read from disk with the lock released and without populating the
+        cache, so a corpus-wide pass neither blocks other operations nor
+        evicts the working set.
+        """
+        async with self._lock:
+            cached = dict(self.notes)
+            entries = [
+                (name, info['path']) for name, info in self._index.items()
+            ]
+        notes = []
+        for name, path in entries:
+            note = cached.get(name)
+            if note is None:
+                try:
+                    note = await asyncio.to_thread(self._load_one, path)
+                except Exception as e:
+                    logger.error(
+                        f"Error loading note {name}: {e}", exc_info=True
+                    )
+                    continue
+            notes.append(note)
+        return notes
 
     async def get_note_content(self, name: str) -> str:
         note = await self.get_note(name)
@@ -440,37 +1053,90 @@ class ResourceManager:
                 else [query]
             )
 
-            for name, note in self.notes.items():
-                matched = False
-
-                if 'content' in search_fields and query in note.content.lower():
-                    matched = True
-
-                if ('description' in search_fields and note.description 
-                    and query in note.description.lower()):
-                    matched = True
+            # Content and description queries resolve through the inverted
+            # indexes and only candidates are loaded from disk: each query
+            # token must appear inside some indexed token of a match, so
+            # the candidate superset misses nothing, and the substring
+            # verification below keeps baseline semantics — 'cat' matches
+            # "category" and "cat dog" matches "cat dogma". Only a query
+            # with no word characters at all scans every note.
+            tokens = _WORD_RE.findall(query)
+            content_candidates = None
+            if 'content' in search_fields and tokens:
+                content_candidates = self._postings_candidates(
+                    self._token_index, tokens
+                )
+            desc_candidates = None
+            if 'description' in search_fields and tokens:
+                desc_candidates = self._postings_candidates(
+                    self._desc_index, tokens
+                )
 
-                if 'tags' in search_fields and note.tags:
-                    if match_all_tags:
-                        # All query tags must be present in note tags
-                        if all(
-                            any(qt in t.lower() for t in note.tags)
-                            for qt in query_tags
-                        ):
-                            matched = True
-                    else:
-                        # Any query tag match is sufficient
-                        if any(
-                            any(qt in t.lower() for t in note.tags)
-                            for qt in query_tags
-                        ):
-                            matched = True
+            # Resolve tag queries against the tag->notes map up front:
+            # exact tags are one dict lookup and partial matches only
+            # scan the distinct tags instead of every note's tag list
+            tag_hits = None
+            if 'tags' in search_fields:
+                per_tag_hits = []
+                for qt in query_tags:
+                    hits = set(self._tag_index.get(qt, ()))
+                    for tag, names in self._tag_index.items():
+                        if qt in tag:
+                            hits |= names
+                    per_tag_hits.append(hits)
+                if match_all_tags:
+                    tag_hits = set.intersection(*per_tag_hits)
+                else:
+                    tag_hits = set.union(*per_tag_hits)
+
+            for name in list(self._index):
+                matched = tag_hits is not None and name in tag_hits
+                note = None
+
+                if (not matched and 'content' in search_fields
+                        and (content_candidates is None
+                             or name in content_candidates)):
+                    note = await self._get_or_load(name)
+                    if note is not None and query in note.content_lower:
+                        matched = True
+
+                if (not matched and 'description' in search_fields
+                        and (desc_candidates is None
+                             or name in desc_candidates)):
+                    note = note or await self._get_or_load(name)
+                    if (note is not None and note.description
+                            and query in note.description.lower()):
+                        matched = True
 
                 if matched:
-                    results[name] = note
+                    note = note or await self._get_or_load(name)
+                    if note is not None:
+                        results[name] = note
 
         return results
 
+    def _postings_candidates(
+        self, index: dict[str, set[str]], tokens: list[str]
+    ) -> set[str]:
+        """Candidate names for a substring query, from the posting lists.
+
+        Every maximal word-character run of the query must occur inside
+        some word-character run of a matching note, so for each query
+        token the union of postings of indexed tokens containing it is a
+        superset of the true matches; their intersection bounds the notes
+        worth verifying. Scans distinct tokens, not notes.
+        """
+        candidates = None
+        for qt in tokens:
+            hits = set()
+            for token, names in index.items():
+                if qt in token:
+                    hits |= names
+            if not hits:
+                return set()
+            candidates = hits if candidates is None else candidates & hits
+        return candidates if candidates is not None else set()
+
 # Initialize the resource manager as a singleton
 _resource_manager = None
 
@@ -553,20 +1219,20 @@ async def delete_note(name: str) -> str:
 @mcp_server.tool()
 async def list_notes() -> str:
     """List all available notes."""
-    notes = await resource_manager.list_notes()
-    if not notes:
+    # Listing fields live in the index entries, so this never reads
+    # note files regardless of corpus size
+    entries = await resource_manager.list_entries()
+    if not entries:
         return "No notes found"
 
-    result = []
-    for name in notes:
-        note = await resource_manager.get_note(name)
-        result.append(
-            f"Note: {name}\n"
-            f"Tags: {note.tags}\n"
-            f"Created: {note.created.isoformat()}\n"
-            f"Description: {note.description or 'No description'}\n"
-            "---"
-        )
+    result = [
+        f"Note: {name}\n"
+        f"Tags: {entry.get('tags', [])}\n"
+        f"Created: {entry['created']}\n"
+        f"Description: {entry.get('description') or 'No description'}\n"
+        "---"
+        for name, entry in entries
+    ]
     return "\n\n".join(result)
 
 @mcp_server.tool()
@@ -580,41 +1246,49 @@ async def search_notes(
     if not results:
         return "No matching notes found."
 
-    result = []
+    # Stream into one buffer instead of accumulating per-hit strings
+    # and joining them at the end
+    buf = io.StringIO()
+    buf.write(f"Found {len(results)} matching note(s):")
     for name, note in results.items():
-        result.append(
-            f"Note: {name}\n"
+        buf.write(
+            f"\n\nNote: {name}\n"
             f"Content: {note.content[:100]}...\n"
             f"Tags: {note.tags}\n"
-            f"Created: {note.created.isoformat()}\n"
+            f"Created: {note.created_iso}\n"
             f"Description: {note.description or 'No description'}\n"
             "---"
         )
-    return f"Found {len(results)} matching note(s):\n\n" + "\n\n".join(result)
+    return buf.getvalue()
 
 @mcp_server.prompt()
 async def summarize_notes(style: str = "brief") -> str:
     """Create a summary of all notes."""
-    notes = await resource_manager.list_notes()
-    if not notes:
-        return "No notes to summarize."
+    if style == "brief":
+        # Brief summaries come straight from the index entries; only the
+        # detailed style below needs to load full note content
+        entries = await resource_manager.list_entries()
+        if not entries:
+            return "No notes to summarize."
+        body = "\n".join(
+            f"- {name}: {entry.get('excerpt', '')}..."
+            for name, entry in entries
+        )
+        return f"Brief summary of {len(entries)} notes:\n\n{body}"
 
-    result = []
-    for name in notes:
-        note = await resource_manager.get_note(name)
-        if style == "brief":
-            result.append(f"- {name}: {note.content[:50]}...")
-        else:
-            result.append(
-                f"Note: {name}\n"
-                f"Content: {note.content}\n"
-                f"Tags: {note.tags}\n"
-                f"Created: {note.created.isoformat()}\n"
-                f"Description: {note.description or 'No description'}"
-            )
+    snapshot = await resource_manager.snapshot()
+    if not snapshot:
+        return "No notes to summarize."
 
-    style_text = "Brief summary" if style == "brief" else "Detailed summary"
-    return f"{style_text} of {len(notes)} notes:\n\n" + "\n\n".join(result)
+    body = "\n\n".join(
+        f"Note: {note.name}\n"
+        f"Content: {note.content}\n"
+        f"Tags: {note.tags}\n"
+        f"Created: {note.created_iso}\n"
+        f"Description: {note.description or 'No description'}"
+        for note in snapshot
+    )
+    return f"Detailed summary of {len(snapshot)} notes:\n\n{body}"
 
 def main():
     """Run the server."""